@@ -6,16 +6,32 @@ from __future__ import annotations
 
 ##############################################################################
 # Python imports.
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import datetime
-from pathlib import Path
-from typing import ClassVar, Iterable, NamedTuple, Optional
+from enum import Enum
+from functools import lru_cache, partial
+from operator import attrgetter
+from pathlib import Path, PosixPath, WindowsPath
+from threading import Lock
+from time import localtime, monotonic, strftime
+from typing import (
+    Callable,
+    ClassVar,
+    Iterable,
+    Iterator,
+    Literal,
+    NamedTuple,
+    Optional,
+)
 
 ##############################################################################
 # Rich imports.
-from rich.console import RenderableType
+from rich.align import AlignMethod
+from rich.console import Console, ConsoleOptions, RenderableType, RenderResult
+from rich.measure import Measurement
 from rich.style import Style
-from rich.table import Table
 from rich.text import Text
 
 ##############################################################################
@@ -25,7 +41,7 @@ from textual.message import Message
 from textual.reactive import var
 from textual.widgets import OptionList
 from textual.widgets.option_list import Option
-from textual.worker import get_current_worker
+from textual.worker import Worker, get_current_worker
 from typing_extensions import Final
 
 ##############################################################################
@@ -33,6 +49,65 @@ from typing_extensions import Final
 from ..path_filters import Filter
 from ..path_maker import MakePath
 from ..safe_tests import is_dir, is_file, is_symlink
+from ..stats import CONCURRENT_STAT_WORKERS, is_remote, safe_stat, stat_all
+
+
+##############################################################################
+class _Unstated(Enum):
+    """Type of the marker for a `stat` that hasn't been supplied."""
+
+    UNSTATED = "unstated"
+    """Marks that no `stat` has been supplied."""
+
+
+##############################################################################
+def _is_local(location: Path) -> bool:
+    """Is the given location a plain local `pathlib` path?
+
+    Args:
+        location: The location to test.
+
+    Returns:
+        `True` if the location is a plain local path, `False` if it's
+        some other sort of `Path` (one set up with `MakePath`, for
+        example).
+    """
+    return type(location) in (PosixPath, WindowsPath)
+
+
+##############################################################################
+def _scan(location: Path) -> Iterator[Path | os.DirEntry[str]]:
+    """Scan the given location for its entries.
+
+    Args:
+        location: The location to scan.
+
+    Yields:
+        The entries found in the location.
+
+    Note:
+        For a plain local path `os.scandir` is used, as this gets the type
+        of each entry along with its name; any other sort of `Path` is left
+        to list its own entries with `iterdir`.
+    """
+    if _is_local(location):
+        with os.scandir(location) as entries:
+            yield from entries
+    else:
+        yield from location.iterdir()
+
+
+##############################################################################
+def _is_hidden(name: str) -> bool:
+    """Does the given name appear to be that of a hidden entry?
+
+    Args:
+        name: The name to test.
+
+    Returns:
+        `True` if the name appears to be hidden, `False` if not.
+    """
+    return name.startswith(".") and name != ".."
 
 
 ##############################################################################
@@ -53,7 +128,105 @@ class DirectoryEntryStyling(NamedTuple):
 
 
 ##############################################################################
-class DirectoryEntry(Option):
+class DirectoryEntryRow:  # pylint:disable=too-few-public-methods
+    """The renderable for a row in the directory navigation display.
+
+    The row is a single line of text, laid out in columns; the name column
+    takes up whatever width is left after the fixed-width columns.
+    """
+
+    ICON_WIDTH: Final[int] = 3
+    """The width of the icon column."""
+
+    SIZE_WIDTH: Final[int] = 10
+    """The width of the size column."""
+
+    TIME_WIDTH: Final[int] = 20
+    """The width of the time column."""
+
+    FIXED_WIDTH: Final[int] = 1 + ICON_WIDTH + SIZE_WIDTH + TIME_WIDTH + 1
+    """The width taken up by everything other than the name column."""
+
+    def __init__(self, icon: Text, name: Text, size: Text, time: Text) -> None:
+        """Initialise the row.
+
+        Args:
+            icon: The icon for the entry.
+            name: The name of the entry.
+            size: The size of the entry.
+            time: The modification time of the entry.
+        """
+        self._icon = self._fit(icon, self.ICON_WIDTH, "left")
+        self._name = name
+        self._size = size
+        self._time = self._fit(time, self.TIME_WIDTH, "right")
+        self._line: tuple[int, Text] | None = None
+        """The most recently rendered line, and the width it was rendered for."""
+
+    @staticmethod
+    def _fit(text: Text, width: int, justify: AlignMethod) -> Text:
+        """Fit some text into a column.
+
+        Args:
+            text: The text to fit.
+            width: The width of the column.
+            justify: How to justify the text within the column.
+
+        Returns:
+            A copy of the text, padded or truncated to fit the column.
+
+        Note:
+            Text that is too wide for the column is truncated with an
+            ellipsis, so that it's obvious that something is missing.
+        """
+        fitted = text.copy()
+        fitted.truncate(width, overflow="ellipsis")
+        fitted.align(justify, width)
+        return fitted
+
+    def line(self, width: int) -> Text:
+        """Get the row as a line of text for the given width.
+
+        Args:
+            width: The width to lay the row out in.
+
+        Returns:
+            The row as a single line of text.
+        """
+        if self._line is None or self._line[0] != width:
+            # The name gets whatever is left over once the fixed-width
+            # columns have been accounted for, but always at least
+            # something; if that leaves us too wide, narrow the size column
+            # before anything else.
+            name_width = max(width - self.FIXED_WIDTH, 1)
+            name = self._fit(self._name, name_width, "left")
+            size = self._fit(
+                self._size,
+                max(self.SIZE_WIDTH - (self.FIXED_WIDTH + name_width - width), 0),
+                "right",
+            )
+            line = Text.assemble(" ", self._icon, name, size, self._time, " ")
+            line.truncate(width)
+            self._line = (width, line)
+        return self._line[1]
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> RenderResult:
+        """Render the row for Rich."""
+        del console
+        yield self.line(options.max_width)
+
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        """Measure the row for Rich."""
+        del console
+        return Measurement(self.FIXED_WIDTH, options.max_width)
+
+
+##############################################################################
+class DirectoryEntry(Option):  # pylint:disable=too-many-instance-attributes
     """A directory entry for the `DirectoryNavigation` class."""
 
     FOLDER_ICON: Final[Text] = Text.from_markup(":file_folder:")
@@ -65,123 +238,161 @@ class DirectoryEntry(Option):
     LINK_ICON: Final[Text] = Text.from_markup(":link:")
     """The icon to use for links."""
 
-    def __init__(self, location: Path, styles: DirectoryEntryStyling) -> None:
-        self.location: Path = location.absolute()
-        """The location of this directory entry."""
-        self._styles = styles
-        super().__init__(self._as_renderable(location))
-
-    @classmethod
-    def _name(cls, location: Path) -> Text:
-        """Get a formatted name for the given location.
+    TIME_FORMAT: Final[str] = "%Y-%m-%d %H:%M:%S"
+    """The format to use when showing the modification time of an entry."""
+
+    def __init__(
+        self,
+        location: Path | os.DirEntry[str],
+        styles: DirectoryEntryStyling,
+        stat_result: os.stat_result | None | Literal[_Unstated.UNSTATED] = (
+            _Unstated.UNSTATED
+        ),
+        hidden_test: Callable[[Path], bool] | None = None,
+    ) -> None:
+        """Initialise the directory entry.
 
         Args:
-            location: The location to get the name for.
+            location: The location of the entry.
+            styles: The styles to use for the entry.
+            stat_result: Optional already-acquired `stat` of the location,
+                which may be `None` if it couldn't be had.
+            hidden_test: Optional test of whether the location is hidden.
 
-        Returns:
-            The formatted name.
+        Note:
+            If `stat_result` isn't provided the location will be `stat`ed
+            to get its details. When `location` is a `DirEntry` its path is
+            taken to already be absolute, and the details of the entry are
+            taken from what it has cached, where possible.
+
+            If `hidden_test` isn't provided, whether or not the entry is
+            hidden is decided by its name alone.
         """
-        return Text.assemble(
-            location.name, " ", cls.LINK_ICON if is_symlink(location) else ""
+        self._location: Path | None = None
+        """The location of this directory entry, made when first needed."""
+        if isinstance(location, os.DirEntry):
+            self._path = location.path
+        else:
+            self._location = location.absolute()
+            self._path = str(self._location)
+        self._styles = styles
+        self._stat = (
+            safe_stat(location) if stat_result is _Unstated.UNSTATED else stat_result
+        )
+        """The `stat` of the location, or `None` if it couldn't be found."""
+        self.is_dir = is_dir(location)
+        """Is this entry a directory?"""
+        self.is_symlink = is_symlink(location)
+        """Is this entry a symlink?"""
+        self._name = os.path.basename(self._path)
+        """The name of this directory entry."""
+        self.is_hidden = (
+            _is_hidden(self._name)
+            if hidden_test is None
+            else hidden_test(self.location)
         )
+        """Is this entry hidden?"""
+        self._sort_key = (not self.is_dir, self._name.casefold())
+        """The key to use when sorting entries; directories first, then by name."""
+        super().__init__("")
+        self._built_prompt: RenderableType | None = None
+        """The prompt for the entry, built when first needed."""
 
-    @staticmethod
-    def _mtime(location: Path) -> str:
-        """Get a formatted modification time for the given location.
+    @property
+    def location(self) -> Path:
+        """The location of this directory entry."""
+        if self._location is None:
+            self._location = MakePath.of(self._path)
+        return self._location
 
-        Args:
-            location: The location to get the modification time for.
+    @property
+    def _prompt(self) -> RenderableType:
+        """The prompt for the entry.
 
-        Returns:
-            The formatted modification time, to the nearest second.
+        Note:
+            The prompt is built on first use and then cached, so entries
+            that never get displayed never pay the cost of building it.
         """
-        try:
-            mtime = location.stat().st_mtime
-        except FileNotFoundError:
-            mtime = 0
-        return datetime.fromtimestamp(int(mtime)).isoformat().replace("T", " ")
+        if self._built_prompt is None:
+            self._built_prompt = self._as_renderable()
+        return self._built_prompt
 
-    @staticmethod
-    def _size(location: Path) -> str:
-        """Get a formatted size for the given location.
+    @_prompt.setter
+    def _prompt(self, prompt: RenderableType) -> None:
+        self._built_prompt = prompt
 
-        Args:
-            location: The location to get the size for.
+    @property
+    def _mtime(self) -> str:
+        """The formatted modification time of the entry, to the nearest second."""
+        return strftime(
+            self.TIME_FORMAT,
+            localtime(0 if self._stat is None else self._stat.st_mtime),
+        )
 
-        Returns:
-            The formatted size.
-        """
-        try:
-            entry_size = location.stat().st_size
-        except FileNotFoundError:
-            entry_size = 0
+    @property
+    def _size(self) -> str:
+        """The formatted size of the entry."""
+        entry_size = 0 if self._stat is None else self._stat.st_size
         # TODO: format well for a file browser.
         return str(entry_size)
 
-    def _style(self, base: Style, location: Path) -> Style:
-        """Decide the best style to use.
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _column_styles(
+        styles: DirectoryEntryStyling, hidden: bool
+    ) -> tuple[Style, Style, Style]:
+        """Decide the styles to use for the name, size and time columns.
 
         Args:
-            base: The base style to start with.
-            location: The location to decide the style for.
+            styles: The styles for directory entries.
+            hidden: Are the styles for a hidden entry?
+
+        Returns:
+            The styles for the name, size and time columns.
+
+        Note:
+            The result is cached, so the styles are worked out once for
+            visible entries and once for hidden entries, rather than once
+            for every entry.
         """
+        if not hidden:
+            return styles.name, styles.size, styles.time
+        hidden_style = Style(
+            color=styles.hidden.color,
+            italic=styles.hidden.italic,
+            bold=styles.hidden.bold,
+            underline=styles.hidden.underline,
+        )
         return (
-            base
-            + Style(
-                color=self._styles.hidden.color,
-                italic=self._styles.hidden.italic,
-                bold=self._styles.hidden.bold,
-                underline=self._styles.hidden.underline,
-            )
-            if DirectoryNavigation.is_hidden(location)
-            else base
+            styles.name + hidden_style,
+            styles.size + hidden_style,
+            styles.time + hidden_style,
         )
 
-    def _as_renderable(self, location: Path) -> RenderableType:
+    def _as_renderable(self) -> RenderableType:
         """Create the renderable for this entry.
 
-        Args:
-            location: The location to turn into a renderable.
-
         Returns:
             The entry as a Rich renderable.
         """
-
-        prompt = Table.grid(expand=True)
-        prompt.add_column(no_wrap=True, width=1)
-        prompt.add_column(no_wrap=True, justify="left", width=3)
-        prompt.add_column(
-            no_wrap=True,
-            justify="left",
-            ratio=1,
-            style=self._style(self._styles.name, location),
-        )
-        prompt.add_column(
-            no_wrap=True,
-            justify="right",
-            width=10,
-            style=self._style(self._styles.size, location),
+        name_style, size_style, time_style = self._column_styles(
+            self._styles, self.is_hidden
         )
-        prompt.add_column(
-            no_wrap=True,
-            justify="right",
-            width=20,
-            style=self._style(self._styles.time, location),
+        return DirectoryEntryRow(
+            self.FOLDER_ICON if self.is_dir else self.FILE_ICON,
+            Text.assemble(
+                self._name,
+                " ",
+                self.LINK_ICON if self.is_symlink else "",
+                style=name_style,
+            ),
+            Text(self._size, style=size_style),
+            Text(self._mtime, style=time_style),
         )
-        prompt.add_column(no_wrap=True, width=1)
-        prompt.add_row(
-            "",
-            self.FOLDER_ICON if is_dir(location) else self.FILE_ICON,
-            self._name(location),
-            self._size(location),
-            self._mtime(location),
-            "",
-        )
-        return prompt
 
 
 ##############################################################################
-class DirectoryNavigation(OptionList):
+class DirectoryNavigation(OptionList):  # pylint:disable=too-many-instance-attributes
     """A directory navigation widget.
 
     Provides a single-pane widget that lets the user navigate their way
@@ -271,6 +482,15 @@ class DirectoryNavigation(OptionList):
     sort_display: var[bool] = var(True)
     """Should the display be sorted?"""
 
+    _BATCH_SIZE: Final[int] = 256
+    """The most entries to load before sending them to the display."""
+
+    _BATCH_INTERVAL: Final[float] = 0.05
+    """The longest time, in seconds, to load before sending entries to the display."""
+
+    _LISTING_CACHE_SIZE: Final[int] = 8
+    """The number of recently loaded listings to keep hold of."""
+
     def __init__(self, location: Path | str = ".") -> None:
         """Initialise the directory navigation widget.
 
@@ -281,6 +501,14 @@ class DirectoryNavigation(OptionList):
         self._mounted = False
         self.location = MakePath.of(location).expanduser().absolute()
         self._entries: list[DirectoryEntry] = []
+        self._hidden_count = 0
+        """The number of hidden entries in the current location."""
+        self._listing_cache: OrderedDict[
+            tuple[str, bool], tuple[int, list[DirectoryEntry]]
+        ] = OrderedDict()
+        """Recently loaded listings, with the modification times of their locations."""
+        self._listing_cache_lock = Lock()
+        """Lock for access to the listing cache."""
 
     @property
     def location(self) -> Path:
@@ -325,7 +553,29 @@ class DirectoryNavigation(OptionList):
             I'll extend this to detect hidden files in the most appropriate
             way for the current operating system.
         """
-        return path.name.startswith(".") and path.name != ".."
+        return _is_hidden(path.name)
+
+    def _overridden(self, method: str) -> bool:
+        """Has the given method been overridden by a subclass?
+
+        Args:
+            method: The name of the method to check.
+
+        Returns:
+            `True` if the method has been overridden, `False` if not.
+        """
+        return getattr(type(self), method) is not getattr(DirectoryNavigation, method)
+
+    @property
+    def _hidden_test(self) -> Callable[[Path], bool] | None:
+        """The test for hidden entries to give to a `DirectoryEntry`.
+
+        Note:
+            If `is_hidden` hasn't been overridden this is `None`, which
+            lets an entry decide if it's hidden from its name alone, without
+            needing to make a `Path` for it.
+        """
+        return self.is_hidden if self._overridden("is_hidden") else None
 
     def hide(self, path: Path) -> bool:
         """Should we hide the given path?
@@ -348,13 +598,25 @@ class DirectoryNavigation(OptionList):
         """Navigate to the parent location"""
         self._location = self._location.parent
 
-    def _sort(self, entries: Iterable[DirectoryEntry]) -> Iterable[DirectoryEntry]:
-        """Sort the entries as per the value of `sort_display`."""
-        if self.sort_display:
-            return sorted(
-                entries,
-                key=lambda entry: (not is_dir(entry.location), entry.location.name),
-            )
+    @staticmethod
+    def _sort(
+        entries: list[DirectoryEntry], sort_display: bool
+    ) -> list[DirectoryEntry]:
+        """Sort the entries as per the value of `sort_display`.
+
+        Args:
+            entries: The entries to sort.
+            sort_display: Should the entries be sorted?
+
+        Returns:
+            The entries, sorted if required.
+
+        Note:
+            If the entries don't need sorting the list that was passed in
+            is returned as-is.
+        """
+        if sort_display:
+            entries.sort(key=attrgetter("_sort_key"))
         return entries
 
     @property
@@ -367,50 +629,230 @@ class DirectoryNavigation(OptionList):
             self.get_component_rich_style("directory-navigation--time", partial=True),
         )
 
+    def _visible(self, entries: Iterable[DirectoryEntry]) -> list[DirectoryEntry]:
+        """Filter the given entries down to those that should be displayed.
+
+        Args:
+            entries: The entries to filter.
+
+        Returns:
+            The entries that should be displayed.
+        """
+        # If the decision about what to hide has been taken over, defer to
+        # that for every entry.
+        if self._overridden("hide"):
+            return [entry for entry in entries if not self.hide(entry.location)]
+        # Otherwise take local copies of the reactive values that decide
+        # what's visible, rather than going through them for every entry.
+        show_hidden = self.show_hidden
+        file_filter = self.file_filter
+        return [
+            entry
+            for entry in entries
+            if (show_hidden or not entry.is_hidden)
+            and (file_filter is None or entry.is_dir or file_filter(entry.location))
+        ]
+
     def _repopulate_display(self) -> None:
         """Repopulate the display of directories."""
-        styles = self._styles
-        with self.app.batch_update():
-            self.clear_options()
-            if not self.is_root:
-                self.add_option(DirectoryEntry(self._location / "..", styles))
-            self.add_options(
-                self._sort(
-                    entry for entry in self._entries if not self.hide(entry.location)
+        options: list[DirectoryEntry] = []
+        if not self.is_root:
+            options.append(
+                DirectoryEntry(
+                    self._location / "..", self._styles, hidden_test=self._hidden_test
                 )
             )
+        options.extend(self._sort(self._visible(self._entries), self.sort_display))
+        with self.app.batch_update():
+            self.clear_options()
+            self.add_options(options)
         self._settle_highlight()
 
+    def _set_entries(self, worker: Worker[None], entries: list[DirectoryEntry]) -> None:
+        """Set the entries for the current location.
+
+        Args:
+            worker: The worker that loaded the entries.
+            entries: The entries to set.
+        """
+        # If the loading worker has been cancelled since these entries were
+        # sent our way, they're for a location we've since moved away from.
+        if worker.is_cancelled:
+            return
+        self._entries = entries
+        self._hidden_count = sum(entry.is_hidden for entry in entries)
+        self._repopulate_display()
+
+    def _add_entries(
+        self, worker: Worker[None], entries: list[DirectoryEntry], final: bool
+    ) -> None:
+        """Add a batch of entries that have been loaded.
+
+        Args:
+            worker: The worker that loaded the entries.
+            entries: The entries to add.
+            final: Is this the final batch of entries for the location?
+
+        Note:
+            If the display is unsorted the entries are added to the end of
+            the display as they arrive; if it has been made sorted since
+            the entries started arriving, the display is repopulated once
+            the final batch has arrived.
+        """
+        # If the loading worker has been cancelled since these entries were
+        # sent our way, they're for a location we've since moved away from.
+        if worker.is_cancelled:
+            return
+        self._entries.extend(entries)
+        self._hidden_count += sum(entry.is_hidden for entry in entries)
+        if self.sort_display:
+            if final:
+                self._repopulate_display()
+        else:
+            with self.app.batch_update():
+                self.add_options(self._visible(entries))
+            self._settle_highlight()
+
+    def _cached_listing(
+        self, key: tuple[str, bool], mtime: int
+    ) -> list[DirectoryEntry] | None:
+        """Get a recently loaded listing, if it's still current.
+
+        Args:
+            key: The key for the listing.
+            mtime: The current modification time of the listing's location.
+
+        Returns:
+            The entries of the listing, or `None` if there's no current
+            listing to hand.
+        """
+        with self._listing_cache_lock:
+            if (cached := self._listing_cache.get(key)) is None or cached[0] != mtime:
+                return None
+            self._listing_cache.move_to_end(key)
+            return cached[1]
+
+    def _cache_listing(
+        self, key: tuple[str, bool], mtime: int, entries: list[DirectoryEntry]
+    ) -> None:
+        """Keep hold of a freshly loaded listing.
+
+        Args:
+            key: The key for the listing.
+            mtime: The modification time of the listing's location.
+            entries: The entries of the listing.
+        """
+        with self._listing_cache_lock:
+            self._listing_cache[key] = (mtime, entries)
+            self._listing_cache.move_to_end(key)
+            while len(self._listing_cache) > self._LISTING_CACHE_SIZE:
+                self._listing_cache.popitem(last=False)
+
     @work(exclusive=True, thread=True)
-    def _load(self) -> None:
-        """Load the current directory data."""
-
-        # Because we might end up slicing and dicing the list, and there's
-        # little point in reloading the data from the filesystem again if
-        # all the user is doing is requesting hidden files be shown/hidden,
-        # or the sort order be changed, or something, we're going to keep a
-        # parallel copy of *all* possible options for the list and then
-        # populate from that.
-        self._entries = []
-
-        # Now loop over the directory, looking for directories within and
-        # streaming them into the list via the app thread.
+    def _load(self) -> None:  # pylint:disable=too-many-locals
+        """Load the current directory data.
+
+        Note:
+            Because we might end up slicing and dicing the list, and
+            there's little point in reloading the data from the filesystem
+            again if all the user is doing is requesting hidden files be
+            shown/hidden, or the sort order be changed, or something, we're
+            going to keep a parallel copy of *all* possible options for the
+            list and then populate from that.
+        """
+
+        # If the display is unsorted the entries can be streamed into it
+        # via the app thread, in batches, as they're found; a batch is sent
+        # either when it's big enough or when enough time has passed, so the
+        # display is kept busy on slow filesystems without being swamped on
+        # fast ones. If the display is sorted nothing can be shown until
+        # everything has been found, so everything is sent in one go.
         worker = get_current_worker()
-        styles = self._styles
+        location = self._location
+        show_files = self.show_files
+        stream = not self.sort_display
+        make_entry = partial(
+            DirectoryEntry, styles=self._styles, hidden_test=self._hidden_test
+        )
+        pending: list[Path | os.DirEntry[str]] = []
+        loaded: list[DirectoryEntry] = []
+        last_sent = monotonic()
+
+        # On a remote filesystem each stat can be a round trip to a server,
+        # so if that's where we are, have a pool of threads on hand to get
+        # the stats of a batch of entries concurrently.
+        executor = (
+            ThreadPoolExecutor(max_workers=CONCURRENT_STAT_WORKERS)
+            if _is_local(location) and is_remote(location)
+            else None
+        )
+
+        def send(final: bool) -> None:
+            """Send the pending entries over to the display."""
+            nonlocal pending
+            # Take the pending entries before doing anything with them, so
+            # that no entry can ever be sent more than once.
+            taken, pending = pending, []
+            batch = [
+                make_entry(entry, stat_result=stat_result)
+                for entry, stat_result in zip(taken, stat_all(taken, executor))
+            ]
+            loaded.extend(batch)
+            if stream:
+                self.app.call_from_thread(self._add_entries, worker, batch, final)
+            else:
+                self.app.call_from_thread(self._set_entries, worker, batch)
+
+        # If the location hasn't changed since we last loaded it, the
+        # listing we loaded then can be used again as-is. Note that a
+        # directory's modification time only changes when entries are added,
+        # removed or renamed, so details such as sizes may be out of date.
+        cache_key = (str(location), show_files)
+        location_stat = safe_stat(location)
+        mtime = None if location_stat is None else location_stat.st_mtime_ns
+
         try:
-            for entry in self._location.iterdir():
-                if is_dir(entry) or (is_file(entry) and self.show_files):
-                    self._entries.append(
-                        DirectoryEntry(self._location / entry.name, styles)
-                    )
-                if worker.is_cancelled:
-                    return
-        except PermissionError:
-            self.post_message(self.PermissionError(self, self._location))
-
-        # Now that we've loaded everything up, let's make the call to update
-        # the display.
-        self.app.call_from_thread(self._repopulate_display)
+            if (
+                mtime is not None
+                and (cached := self._cached_listing(cache_key, mtime)) is not None
+            ):
+                self.app.call_from_thread(self._set_entries, worker, list(cached))
+                return
+            if stream:
+                self.app.call_from_thread(self._set_entries, worker, [])
+            try:
+                for entry in _scan(location):
+                    # Check for cancellation before doing any work on the
+                    # entry, so that a quick succession of location changes
+                    # doesn't pay for entries that will never be seen.
+                    if worker.is_cancelled:
+                        return
+                    if is_dir(entry) or (show_files and is_file(entry)):
+                        pending.append(entry)
+                    if (
+                        stream
+                        and pending
+                        and (
+                            len(pending) >= self._BATCH_SIZE
+                            or monotonic() - last_sent >= self._BATCH_INTERVAL
+                        )
+                    ):
+                        send(False)
+                        last_sent = monotonic()
+            except PermissionError:
+                self.post_message(self.PermissionError(self, location))
+                mtime = None
+
+            # Now that we've loaded everything up, send the remainder over
+            # to finish off the display, and keep hold of the listing in
+            # case we come back this way.
+            if not worker.is_cancelled:
+                send(True)
+                if mtime is not None:
+                    self._cache_listing(cache_key, mtime, loaded)
+        finally:
+            if executor is not None:
+                executor.shutdown(wait=False)
 
     def _watch__location(self) -> None:
         """Reload the content if the location changes."""
@@ -419,14 +861,24 @@ class DirectoryNavigation(OptionList):
 
     def _watch_show_hidden(self) -> None:
         """Refresh the display if the show-hidden flag has changed."""
-        self._repopulate_display()
+        # If there's nothing hidden, the display won't change.
+        if self._hidden_count:
+            self._repopulate_display()
 
     def _watch_show_files(self) -> None:
         """Reload the content if the show-files flag has changed."""
         self._load()
 
-    def _watch_sort_display(self) -> None:
-        """Refresh the display if the sort option has been changed."""
+    def _watch_sort_display(self, sort_display: bool) -> None:
+        """Refresh the display if the sort option has been changed.
+
+        Args:
+            sort_display: The new value of the sort option.
+        """
+        # If we're going to a sorted display from an unsorted display, and
+        # there's nothing to put in order, the display won't change.
+        if sort_display and len(self._entries) <= 1:
+            return
         self._repopulate_display()
 
     def _watch_file_filter(self) -> None:
@@ -459,9 +911,19 @@ class DirectoryNavigation(OptionList):
         event.stop()
         assert isinstance(event.option, DirectoryEntry)
         # If the use has selected a directory...
-        if is_dir(event.option.location):
-            # ...we do navigation and don't post anything from here.
-            self._location = event.option.location.resolve()
+        if event.option.is_dir:
+            # ...we do navigation and don't post anything from here. Note
+            # that a plain local location only needs to be fully resolved
+            # if it's a symlink; otherwise it's already absolute and just
+            # needs tidying up (of a trailing `..`, for example), which can
+            # be done without going anywhere near the filesystem. Any other
+            # sort of location is left to resolve itself, as it knows best.
+            location = event.option.location
+            self._location = (
+                MakePath.of(os.path.normpath(location))
+                if _is_local(location) and not event.option.is_symlink
+                else location.resolve()
+            )
         else:
             # If it's not a directory it should be a file; that should be a
             # selection event.
@@ -1,17 +1,27 @@
 """Provides a widget for drive navigation."""
 
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
 ##############################################################################
 # Python imports.
 import sys
 from dataclasses import dataclass
 from pathlib import Path
+from string import ascii_uppercase
+from time import monotonic
+
+##############################################################################
+# Windows-specific imports.
+if sys.platform == "win32":
+    from ctypes import windll
 
 ##############################################################################
 # Import or provide a version of listdrives.
 try:
     from os import listdrives  # type: ignore[attr-defined]
 except ImportError:
-    import string
 
     def listdrives() -> list[str]:
         """Return a list containing the names of drives in the system.
@@ -24,24 +34,73 @@ except ImportError:
             list[str]: The list of available drives.
         """
         return [
-            f"{letter}:"
-            for letter in string.ascii_uppercase
-            if Path(f"{letter}:\\").exists()
+            f"{letter}:" for letter in ascii_uppercase if Path(f"{letter}:\\").exists()
         ]
 
 
 ##############################################################################
 # Textual imports.
-from textual import on
+from textual import on, work
 from textual.message import Message
 from textual.reactive import var
 from textual.widgets import OptionList
-from textual.widgets.option_list import Option
+from textual.widgets.option_list import Option, OptionDoesNotExist
+from typing_extensions import Final
 
 ##############################################################################
 # Local imports.
 from ..path_maker import MakePath
 
+##############################################################################
+DRIVE_CACHE_TIME: Final[float] = 30.0
+"""How long, in seconds, the list of drives is cached for."""
+
+
+##############################################################################
+def _logical_drives() -> list[str]:
+    """Return a list containing the names of drives in the system.
+
+    Returns:
+        The list of available drives.
+
+    Note:
+        On Windows this asks for the bitmask of logical drives, which is a
+        single call that doesn't probe each drive; this means that slow or
+        disconnected drives don't hold things up. Elsewhere, or if the
+        bitmask can't be had, this falls back to `listdrives`.
+    """
+    if sys.platform == "win32":
+        if drives := windll.kernel32.GetLogicalDrives():
+            return [
+                f"{letter}:\\"
+                for bit, letter in enumerate(ascii_uppercase)
+                if drives & (1 << bit)
+            ]
+    return list(listdrives())
+
+
+##############################################################################
+_drive_cache: tuple[float, tuple[str, ...]] | None = None  # pylint:disable=invalid-name
+"""The most recently listed drives, along with when they were listed."""
+
+
+##############################################################################
+def _list_drives() -> tuple[str, ...]:
+    """Get the drives in the system.
+
+    Returns:
+        The drives in the system.
+
+    Note:
+        Listing the drives can be slow, so the result is cached for
+        `DRIVE_CACHE_TIME` seconds from when the listing finished.
+    """
+    global _drive_cache  # pylint:disable=global-statement
+    if _drive_cache is None or monotonic() - _drive_cache[0] >= DRIVE_CACHE_TIME:
+        drives = tuple(_logical_drives())
+        _drive_cache = (monotonic(), drives)
+    return _drive_cache[1]
+
 
 ##############################################################################
 class DriveEntry(Option):
@@ -99,14 +158,35 @@ class DriveNavigation(OptionList):
         """
         super().__init__()
         self.set_reactive(DriveNavigation.drive, MakePath.of(location).absolute().drive)
-        if sys.platform == "win32":
-            self._entries = [DriveEntry(drive) for drive in listdrives()]
-        else:
-            self._entries: list[DriveEntry] = []
 
     def on_mount(self) -> None:
-        """Add available drives to the widget."""
-        self.add_options(self._entries)
+        """Start loading the available drives once the DOM is ready."""
+        # Drives are only a thing on Windows; anywhere else there's nothing
+        # to load.
+        if sys.platform == "win32":
+            self._load()
+
+    @work(exclusive=True, thread=True)
+    def _load(self) -> None:
+        """Load the available drives.
+
+        Note:
+            Drives are listed in a thread as doing so can block for some
+            time, for example while disconnected network drives are probed.
+        """
+        self.app.call_from_thread(
+            self._show_drives, [DriveEntry(drive) for drive in _list_drives()]
+        )
+
+    def _show_drives(self, entries: list[DriveEntry]) -> None:
+        """Show the given drives in the widget.
+
+        Args:
+            entries: The entries for the drives to show.
+        """
+        with self.app.batch_update():
+            self.clear_options()
+            self.add_options(entries)
         self.highlight_drive(self.drive)
 
     def _watch_drive(self, drive: str) -> None:
@@ -123,7 +203,11 @@ class DriveNavigation(OptionList):
         Args:
             drive: The drive to be highlighted.
         """
-        self.highlighted = self.get_option_index(drive.upper())
+        try:
+            self.highlighted = self.get_option_index(drive.upper())
+        except OptionDoesNotExist:
+            # The drive isn't (or isn't yet) one we know about.
+            pass
 
     @on(OptionList.OptionSelected)
     def drive_selected(self, event: OptionList.OptionSelected) -> None:
@@ -4,15 +4,46 @@ This module provides some functions for performing tests on entries in the
 filesystem in a way that swallows some errors that we don't want causing the
 application to crash on. In most cases this is going to be a
 PermissionError, which for UI stuff is better ignored than raised.
+
+Note that `Path` already treats some errors as the test simply being
+`False`; a `DirEntry` raises those errors instead, so they are handled here
+in the same way as `Path` handles them.
 """
 
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
 ##############################################################################
 # Python imports.
+from errno import EBADF, ELOOP, ENOENT, ENOTDIR
+from os import DirEntry
 from pathlib import Path
 
+##############################################################################
+# Typing extension imports.
+from typing_extensions import Final
+
+##############################################################################
+IGNORED_ERRORS: Final[frozenset[int]] = frozenset({ENOENT, ENOTDIR, EBADF, ELOOP})
+"""The errors that mean a test is `False`, rather than a failure."""
+
+
+##############################################################################
+def _ignored(error: OSError) -> bool:
+    """Is the given error one that means the test is simply `False`?
+
+    Args:
+        error: The error to check.
+
+    Returns:
+        `True` if the error should be ignored, `False` if it should be raised.
+    """
+    return error.errno in IGNORED_ERRORS
+
 
 ##############################################################################
-def is_dir(location: Path) -> bool:
+def is_dir(location: Path | DirEntry[str]) -> bool:
     """A safe version of is_dir.
 
     Args:
@@ -30,10 +61,14 @@ def is_dir(location: Path) -> bool:
         return location.is_dir()
     except PermissionError:
         return False
+    except OSError as error:
+        if _ignored(error):
+            return False
+        raise
 
 
 ##############################################################################
-def is_file(location: Path) -> bool:
+def is_file(location: Path | DirEntry[str]) -> bool:
     """A safe version of is_file.
 
     Args:
@@ -51,10 +86,14 @@ def is_file(location: Path) -> bool:
         return location.is_file()
     except PermissionError:
         return True
+    except OSError as error:
+        if _ignored(error):
+            return False
+        raise
 
 
 ##############################################################################
-def is_symlink(location: Path) -> bool:
+def is_symlink(location: Path | DirEntry[str]) -> bool:
     """A safe version of is_symlink.
 
     Args:
@@ -72,6 +111,10 @@ def is_symlink(location: Path) -> bool:
         return location.is_symlink()
     except PermissionError:
         return False
+    except OSError as error:
+        if _ignored(error):
+            return False
+        raise
 
 
 ### safe_tests.py ends here
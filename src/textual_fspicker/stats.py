@@ -0,0 +1,172 @@
+"""Support code for getting the details of entries in the filesystem.
+
+This module provides a safe way of getting the `stat` of an entry in the
+filesystem, along with support for getting the `stat` of many entries at
+once. On local filesystems a `stat` is cheap, but on remote filesystems
+each one can mean a round trip to a server; in that case it makes sense to
+have many of them in flight at the same time.
+"""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import os
+import re
+import sys
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import Sequence
+
+##############################################################################
+# Typing extension imports.
+from typing_extensions import Final
+
+##############################################################################
+REMOTE_FILESYSTEMS: Final[frozenset[str]] = frozenset(
+    {
+        "9p",
+        "afs",
+        "ceph",
+        "cifs",
+        "fuse.rclone",
+        "fuse.sshfs",
+        "glusterfs",
+        "ncpfs",
+        "nfs",
+        "nfs4",
+        "smb3",
+        "smbfs",
+    }
+)
+"""The types of filesystem that are considered to be remote."""
+
+CONCURRENT_STAT_THRESHOLD: Final[int] = 32
+"""The fewest entries that are worth getting the `stat` of concurrently."""
+
+CONCURRENT_STAT_WORKERS: Final[int] = 16
+"""The most `stat`s to have in flight at once."""
+
+_MOUNT_TABLE: Final[str] = "/proc/self/mounts"
+"""The location of the mount table."""
+
+_MOUNT_ESCAPE: Final = re.compile(r"\\([0-7]{3})")
+"""Regular expression for the octal escapes used in the mount table."""
+
+_remote_devices: Final[dict[int, bool]] = {}
+"""Cache of which devices have been found to be remote, keyed by device ID."""
+
+
+##############################################################################
+def safe_stat(location: Path | os.DirEntry[str]) -> os.stat_result | None:
+    """Get the `stat` of the given location.
+
+    Args:
+        location: The location to `stat`.
+
+    Returns:
+        The result of the `stat`, or `None` if it couldn't be had.
+
+    Note:
+        When given a `DirEntry` the result of the `stat` is cached by the
+        entry itself.
+
+        This function swallows any `OSError` (most likely a
+        `FileNotFoundError` or a `PermissionError`), so that one awkward
+        entry can't stop a whole directory from being listed.
+    """
+    try:
+        return location.stat()
+    except OSError:
+        return None
+
+
+##############################################################################
+def _mounted_remotely(location: Path) -> bool:
+    """Does the mount table say the given location is on a remote filesystem?
+
+    Args:
+        location: The location to test.
+
+    Returns:
+        `True` if the location looks to be on a remote filesystem, `False`
+        if not, or if it could not be determined.
+    """
+    try:
+        with open(_MOUNT_TABLE, encoding="utf-8") as mounts:
+            table = mounts.readlines()
+    except OSError:
+        return False
+    # Note that the location is fully resolved before looking for it in
+    # the table, as the table only knows about real paths; a symlink that
+    # lives on one filesystem can point into another.
+    path = os.path.realpath(location)
+    best_match = ""
+    filesystem = ""
+    for mount in table:
+        try:
+            _, mount_point, mount_type, *_ = mount.split()
+        except ValueError:
+            continue
+        mount_point = _MOUNT_ESCAPE.sub(
+            lambda escape: chr(int(escape[1], 8)), mount_point
+        )
+        if len(mount_point) >= len(best_match) and (
+            path == mount_point or path.startswith(mount_point.rstrip("/") + "/")
+        ):
+            best_match, filesystem = mount_point, mount_type
+    return filesystem in REMOTE_FILESYSTEMS
+
+
+##############################################################################
+def is_remote(location: Path) -> bool:
+    """Does the given location appear to be on a remote filesystem?
+
+    Args:
+        location: The location to test.
+
+    Returns:
+        `True` if the location looks to be on a remote filesystem, `False`
+        if not, or if it could not be determined.
+
+    Note:
+        For the moment this is only able to tell on Linux, where the mount
+        table is consulted; everywhere else the location is assumed to be
+        local. The answer is cached for the device the location is on, so
+        the mount table is only consulted the first time a device is seen.
+    """
+    if sys.platform != "linux":
+        return False
+    if (stat_result := safe_stat(location)) is None:
+        return False
+    if (remote := _remote_devices.get(stat_result.st_dev)) is None:
+        remote = _remote_devices[stat_result.st_dev] = _mounted_remotely(location)
+    return remote
+
+
+##############################################################################
+def stat_all(
+    entries: Sequence[Path | os.DirEntry[str]],
+    executor: Executor | None = None,
+) -> list[os.stat_result | None]:
+    """Get the `stat` of all of the given entries.
+
+    Args:
+        entries: The entries to `stat`.
+        executor: Optional executor to use to `stat` the entries concurrently.
+
+    Returns:
+        The `stat` of each of the entries, in the same order as the entries.
+
+    Note:
+        The entries are only `stat`ed concurrently if an executor is given
+        and there are enough entries to make it worthwhile.
+    """
+    if executor is None or len(entries) < CONCURRENT_STAT_THRESHOLD:
+        return [safe_stat(entry) for entry in entries]
+    return list(executor.map(safe_stat, entries))
+
+
+### stats.py ends here
@@ -0,0 +1,295 @@
+"""Tests for the directory navigation widget."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import asyncio
+import os
+import re
+import stat
+from pathlib import Path, PosixPath
+from typing import Any, Generator
+
+##############################################################################
+# Pytest imports.
+import pytest
+
+##############################################################################
+# Rich imports.
+from rich.style import Style
+from rich.text import Text
+
+##############################################################################
+# Textual imports.
+from textual.app import App, ComposeResult
+
+##############################################################################
+# Local imports.
+from textual_fspicker import MakePath
+from textual_fspicker.parts import DirectoryNavigation, directory_navigation
+from textual_fspicker.parts.directory_navigation import (
+    DirectoryEntry,
+    DirectoryEntryRow,
+    DirectoryEntryStyling,
+)
+
+
+##############################################################################
+class BackupsHidden(DirectoryNavigation):
+    """Directory navigation that also considers backup files to be hidden."""
+
+    @staticmethod
+    def is_hidden(path: Path) -> bool:
+        return DirectoryNavigation.is_hidden(path) or path.name.endswith("~")
+
+
+##############################################################################
+class TextOnly(DirectoryNavigation):
+    """Directory navigation that hides everything but text files."""
+
+    def hide(self, path: Path) -> bool:
+        return path.suffix != ".txt"
+
+
+##############################################################################
+class VirtualPath(PosixPath):
+    """A path into a small, made-up, filesystem."""
+
+    DIRECTORIES = {"/", "/resolved", "/virtual"}
+    """The directories in the filesystem."""
+
+    FILES = {"/virtual/a"}
+    """The files in the filesystem."""
+
+    @property
+    def _virtual(self) -> str:
+        """The path within the made-up filesystem."""
+        return os.path.normpath(str(self))
+
+    def iterdir(self) -> Generator[VirtualPath, None, None]:
+        yield from (
+            self / os.path.basename(entry)
+            for entry in sorted(self.DIRECTORIES | self.FILES)
+            if entry != "/" and os.path.dirname(entry) == self._virtual
+        )
+
+    def is_dir(self, **_: Any) -> bool:
+        return self._virtual in self.DIRECTORIES
+
+    def is_file(self, **_: Any) -> bool:
+        return self._virtual in self.FILES
+
+    def is_symlink(self) -> bool:
+        return False
+
+    def resolve(self, strict: bool = False) -> VirtualPath:
+        return type(self)(os.path.join(self._virtual, "resolved"))
+
+    def stat(self, **_: Any) -> os.stat_result:
+        if self.is_dir():
+            return os.stat_result((stat.S_IFDIR, 0, 0, 0, 0, 0, 0, 0, 0, 0))
+        if self.is_file():
+            return os.stat_result((stat.S_IFREG, 0, 0, 0, 0, 0, 42, 0, 0, 0))
+        raise FileNotFoundError(self)
+
+
+##############################################################################
+def _shown(navigation: type[DirectoryNavigation], location: Path) -> list[str]:
+    """Get the names of the entries shown by a directory navigation widget.
+
+    Args:
+        navigation: The type of directory navigation widget to use.
+        location: The location to show.
+
+    Returns:
+        The names of the entries shown, in the order they're shown.
+    """
+
+    class Picker(App[None]):
+        """An app that shows a directory navigation widget."""
+
+        def compose(self) -> ComposeResult:
+            yield navigation(location)
+
+    async def run() -> list[str]:
+        async with (app := Picker()).run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            widget = app.query_one(DirectoryNavigation)
+            return [
+                option.location.name
+                for option in (
+                    widget.get_option_at_index(index)
+                    for index in range(widget.option_count)
+                )
+                if isinstance(option, DirectoryEntry)
+            ]
+
+    return asyncio.run(run())
+
+
+##############################################################################
+def test_overridden_is_hidden(tmp_path: Path) -> None:
+    """A subclass should be able to decide what's hidden."""
+    for name in ("file.txt", "file.txt~", ".dotfile"):
+        (tmp_path / name).touch()
+    assert _shown(DirectoryNavigation, tmp_path) == ["..", "file.txt", "file.txt~"]
+    assert _shown(BackupsHidden, tmp_path) == ["..", "file.txt"]
+
+
+##############################################################################
+def test_overridden_hide(tmp_path: Path) -> None:
+    """A subclass should be able to decide what's displayed."""
+    for name in ("file.txt", "file.md", ".dotfile.txt"):
+        (tmp_path / name).touch()
+    assert _shown(TextOnly, tmp_path) == ["..", ".dotfile.txt", "file.txt"]
+
+
+##############################################################################
+def test_custom_path_class() -> None:
+    """A `Path` class set up with `MakePath` should be used for listing."""
+    MakePath.using(VirtualPath)
+    try:
+        assert _shown(DirectoryNavigation, VirtualPath("/virtual")) == [
+            "..",
+            "a",
+        ]
+    finally:
+        MakePath.using(Path)
+
+
+##############################################################################
+def test_custom_path_class_navigation() -> None:
+    """A `Path` class set up with `MakePath` should resolve its own locations."""
+    MakePath.using(VirtualPath)
+
+    class Picker(App[None]):
+        """An app that shows a directory navigation widget."""
+
+        def compose(self) -> ComposeResult:
+            yield DirectoryNavigation(VirtualPath("/virtual"))
+
+    async def run() -> Path:
+        async with (app := Picker()).run_test() as pilot:
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            navigation = app.query_one(DirectoryNavigation)
+            navigation.focus()
+            navigation.highlighted = 0
+            await pilot.press("enter")
+            return navigation.location
+
+    try:
+        assert asyncio.run(run()) == VirtualPath("/resolved")
+    finally:
+        MakePath.using(Path)
+
+
+##############################################################################
+def test_listing_cache(tmp_path: Path) -> None:
+    """A listing should be reused for as long as its location is unchanged."""
+    (tmp_path / "file").touch()
+    (tmp_path / "sub").mkdir()
+
+    class Picker(App[None]):
+        """An app that shows a directory navigation widget."""
+
+        def compose(self) -> ComposeResult:
+            yield DirectoryNavigation(tmp_path)
+
+    async def run() -> None:
+        async with (app := Picker()).run_test() as pilot:
+            navigation = app.query_one(DirectoryNavigation)
+
+            async def visit(location: Path) -> list[DirectoryEntry]:
+                navigation.location = location
+                await app.workers.wait_for_complete()
+                await pilot.pause()
+                return navigation._entries
+
+            first = await visit(tmp_path)
+            assert {entry.location.name for entry in first} == {"file", "sub"}
+            # Coming back to an unchanged location should reuse its entries.
+            await visit(tmp_path / "sub")
+            assert [id(entry) for entry in await visit(tmp_path)] == [
+                id(entry) for entry in first
+            ]
+            # Coming back to a location that has changed should load it again.
+            await visit(tmp_path / "sub")
+            (tmp_path / "new").touch()
+            second = await visit(tmp_path)
+            assert {entry.location.name for entry in second} == {
+                "file",
+                "new",
+                "sub",
+            }
+            assert not {id(entry) for entry in second} & {id(entry) for entry in first}
+            # Whether files are shown or not should get a listing of its own.
+            navigation.show_files = False
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert [entry.location.name for entry in navigation._entries] == ["sub"]
+            navigation.show_files = True
+            await app.workers.wait_for_complete()
+            await pilot.pause()
+            assert [id(entry) for entry in navigation._entries] == [
+                id(entry) for entry in second
+            ]
+
+    asyncio.run(run())
+
+
+##############################################################################
+def test_entry_with_failed_stat(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """An entry given a failed stat shouldn't try the stat again."""
+    stated: list[object] = []
+    monkeypatch.setattr(directory_navigation, "safe_stat", stated.append)
+    styles = DirectoryEntryStyling(Style(), Style(), Style(), Style())
+    DirectoryEntry(tmp_path, styles, None)
+    assert not stated
+    DirectoryEntry(tmp_path, styles)
+    assert stated == [tmp_path]
+
+
+##############################################################################
+def _row(size: str, width: int) -> str:
+    """Get the text of a row for an entry of the given size.
+
+    Args:
+        size: The size to show in the row.
+        width: The width to lay the row out in.
+
+    Returns:
+        The plain text of the row.
+    """
+    line = DirectoryEntryRow(
+        DirectoryEntry.FILE_ICON, Text("name"), Text(size), Text("yesterday")
+    ).line(width)
+    assert line.cell_len <= width
+    return line.plain
+
+
+##############################################################################
+def test_row_with_oversized_size() -> None:
+    """A size too wide for its column should be truncated with an ellipsis."""
+    assert _row("12345678901", 80).endswith(" 123456789…           yesterday ")
+    assert _row("1234567890", 80).endswith(" 1234567890           yesterday ")
+
+
+##############################################################################
+def test_row_at_narrow_widths() -> None:
+    """Narrowing a row should never show a size that is wrong."""
+    for size in ("0", "4096", "1234567890", "12345678901"):
+        for width in range(1, 80):
+            for shown in re.findall(r"\d+…?", _row(size, width)):
+                assert shown == size or (
+                    shown.endswith("…") and size.startswith(shown[:-1])
+                ), (size, width, shown)
+
+
+### test_directory_navigation.py ends here
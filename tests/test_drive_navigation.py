@@ -0,0 +1,38 @@
+"""Tests for the drive navigation widget."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Pytest imports.
+import pytest
+
+##############################################################################
+# Local imports.
+from textual_fspicker.parts import drive_navigation
+from textual_fspicker.parts.drive_navigation import DRIVE_CACHE_TIME
+
+
+##############################################################################
+def test_drive_list_cached(monkeypatch: pytest.MonkeyPatch) -> None:
+    """The drive list should be cached for `DRIVE_CACHE_TIME` seconds."""
+    now = 1000.0
+    listings: list[float] = []
+
+    def logical_drives() -> list[str]:
+        listings.append(now)
+        return [f"{len(listings)}:\\"]
+
+    monkeypatch.setattr(drive_navigation, "_drive_cache", None)
+    monkeypatch.setattr(drive_navigation, "monotonic", lambda: now)
+    monkeypatch.setattr(drive_navigation, "_logical_drives", logical_drives)
+    assert drive_navigation._list_drives() == ("1:\\",)
+    now += DRIVE_CACHE_TIME - 1
+    assert drive_navigation._list_drives() == ("1:\\",)
+    now += 1
+    assert drive_navigation._list_drives() == ("2:\\",)
+    assert listings == [1000.0, 1000.0 + DRIVE_CACHE_TIME]
+
+
+### test_drive_navigation.py ends here
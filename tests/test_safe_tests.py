@@ -0,0 +1,63 @@
+"""Tests for the safe filesystem tests."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import os
+from pathlib import Path
+
+##############################################################################
+# Pytest imports.
+import pytest
+
+##############################################################################
+# Local imports.
+from textual_fspicker.safe_tests import is_dir, is_file, is_symlink
+
+
+##############################################################################
+def _entry(location: Path, name: str) -> os.DirEntry[str]:
+    """Get the directory entry with the given name."""
+    with os.scandir(location) as entries:
+        return next(entry for entry in entries if entry.name == name)
+
+
+##############################################################################
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="Needs symlink support")
+def test_self_referencing_symlink(tmp_path: Path) -> None:
+    """A symlink that points at itself should test as neither file nor directory."""
+    (tmp_path / "loop").symlink_to("loop")
+    for location in (tmp_path / "loop", _entry(tmp_path, "loop")):
+        assert is_dir(location) is False
+        assert is_file(location) is False
+        assert is_symlink(location) is True
+
+
+##############################################################################
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="Needs symlink support")
+def test_broken_symlink(tmp_path: Path) -> None:
+    """A symlink that points nowhere should test as neither file nor directory."""
+    (tmp_path / "broken").symlink_to("nowhere")
+    for location in (tmp_path / "broken", _entry(tmp_path, "broken")):
+        assert is_dir(location) is False
+        assert is_file(location) is False
+        assert is_symlink(location) is True
+
+
+##############################################################################
+def test_dir_and_file(tmp_path: Path) -> None:
+    """Plain directories and files should test as expected."""
+    (tmp_path / "directory").mkdir()
+    (tmp_path / "file").touch()
+    for location in (tmp_path / "directory", _entry(tmp_path, "directory")):
+        assert is_dir(location) is True
+        assert is_file(location) is False
+    for location in (tmp_path / "file", _entry(tmp_path, "file")):
+        assert is_dir(location) is False
+        assert is_file(location) is True
+
+
+### test_safe_tests.py ends here
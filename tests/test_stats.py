@@ -0,0 +1,117 @@
+"""Tests for the filesystem stat support code."""
+
+##############################################################################
+# Backward compatibility.
+from __future__ import annotations
+
+##############################################################################
+# Python imports.
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+##############################################################################
+# Pytest imports.
+import pytest
+
+##############################################################################
+# Local imports.
+from textual_fspicker import stats
+from textual_fspicker.stats import (
+    CONCURRENT_STAT_THRESHOLD,
+    is_remote,
+    safe_stat,
+    stat_all,
+)
+
+
+##############################################################################
+def test_safe_stat_missing(tmp_path: Path) -> None:
+    """Getting the stat of something that doesn't exist should give `None`."""
+    assert safe_stat(tmp_path / "missing") is None
+
+
+##############################################################################
+@pytest.mark.skipif(not hasattr(os, "symlink"), reason="Needs symlink support")
+def test_safe_stat_symlink_loop(tmp_path: Path) -> None:
+    """Getting the stat of a self-referencing symlink should give `None`."""
+    (tmp_path / "loop").symlink_to("loop")
+    with os.scandir(tmp_path) as entries:
+        assert [safe_stat(entry) for entry in entries] == [None]
+
+
+##############################################################################
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0,
+    reason="Needs a non-root user on a POSIX system",
+)
+def test_safe_stat_permission_error(tmp_path: Path) -> None:
+    """Getting the stat of something that can't be reached should give `None`."""
+    (hidden := tmp_path / "hidden").mkdir()
+    (hidden / "file").touch()
+    (tmp_path / "link").symlink_to(hidden / "file")
+    hidden.chmod(0)
+    try:
+        with os.scandir(tmp_path) as entries:
+            assert {
+                entry.name: safe_stat(entry) for entry in entries if entry.is_symlink()
+            } == {"link": None}
+    finally:
+        hidden.chmod(0o700)
+
+
+##############################################################################
+@pytest.mark.parametrize("concurrently", (False, True))
+def test_stat_all(tmp_path: Path, concurrently: bool) -> None:
+    """All entries should be stat'ed, in order, with or without an executor."""
+    for file in range(CONCURRENT_STAT_THRESHOLD * 2):
+        (tmp_path / f"{file}").write_text("x" * file)
+    with os.scandir(tmp_path) as scanned:
+        entries = list(scanned)
+    with ThreadPoolExecutor() as executor:
+        stats = stat_all(entries, executor if concurrently else None)
+    assert [stat and stat.st_size for stat in stats] == [
+        int(entry.name) for entry in entries
+    ]
+
+
+##############################################################################
+@pytest.mark.skipif(sys.platform != "linux", reason="Needs the Linux mount table")
+def test_is_remote_cached_by_device(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """The mount table should only be consulted once per device."""
+    consulted: list[Path] = []
+
+    def mounted_remotely(location: Path) -> bool:
+        consulted.append(location)
+        return True
+
+    monkeypatch.setattr(stats, "_remote_devices", {})
+    monkeypatch.setattr(stats, "_mounted_remotely", mounted_remotely)
+    (tmp_path / "sub").mkdir()
+    assert is_remote(tmp_path)
+    assert is_remote(tmp_path / "sub")
+    assert consulted == [tmp_path]
+    assert not is_remote(tmp_path / "missing")
+
+
+##############################################################################
+@pytest.mark.skipif(sys.platform != "linux", reason="Needs the Linux mount table")
+def test_is_remote_through_symlink(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """A symlink into a remote filesystem should be seen as remote."""
+    (remote := tmp_path / "remote").mkdir()
+    (local := tmp_path / "local").mkdir()
+    (link := local / "link").symlink_to(remote)
+    (mounts := tmp_path / "mounts").write_text(
+        f"/dev/root / ext4 rw 0 0\nserver:/export {remote.resolve()} nfs4 rw 0 0\n"
+    )
+    monkeypatch.setattr(stats, "_MOUNT_TABLE", str(mounts))
+    assert stats._mounted_remotely(link)
+    assert not stats._mounted_remotely(local)
+
+
+### test_stats.py ends here